@@ -5,9 +5,15 @@ from creational_patterns.abstract_factory.sms_aws import AwsSmsSender
 from creational_patterns.abstract_factory.sms_sender import ISmsSender
 
 
+# Los senders de AWS no guardan estado, por lo que basta una sola
+# instancia compartida en lugar de crear una nueva en cada llamada.
+_EMAIL_SENDER = AwsEmailSender()
+_SMS_SENDER = AwsSmsSender()
+
+
 class AwsFactory(IProviderFactory):
     def create_email_sender(self) -> IEmailSender:
-        return AwsEmailSender()
+        return _EMAIL_SENDER
 
     def create_sms_sender(self) -> ISmsSender:
-        return AwsSmsSender()
+        return _SMS_SENDER
@@ -1,6 +1,13 @@
+import sys
+
 from creational_patterns.abstract_factory.email_sender import IEmailSender
 
 
 class AwsEmailSender(IEmailSender):
+    __slots__ = ()
+
+    _PREFIX = "Enviando email via AWS a "
+    _MID = "... mensaje: "
+
     def send(self, to: str, message: str) -> None:
-        print(f"Enviando email via AWS a {to}... mensaje: {message}")
+        sys.stdout.write(self._PREFIX + to + self._MID + message + "\n")
@@ -2,10 +2,23 @@ from creational_patterns.abstract_factory.provider_factory import IProviderFacto
 
 
 class NotificationService:
+    __slots__ = ("_send_email", "_send_sms")
+
     def __init__(self, factory: IProviderFactory):
-        self.email_sender = factory.create_email_sender()
-        self.sms_sender = factory.create_sms_sender()
-    
+        # Se guardan los metodos send ya ligados: cada notificacion se
+        # ahorra la busqueda de atributo y la creacion del bound method.
+        self._send_email = factory.create_email_sender().send
+        self._send_sms = factory.create_sms_sender().send
+
     def send_notification(self, email: str, sms: str, message: str) -> None:
-        self.email_sender.send(email, message)
-        self.sms_sender.send(sms, message)
+        self._send_email(email, message)
+        self._send_sms(sms, message)
+
+    def send_batch(self, items: list) -> None:
+        # Bindings locales: dentro del bucle los send se resuelven como
+        # LOAD_FAST en lugar de un lookup de atributo por mensaje.
+        send_email = self._send_email
+        send_sms = self._send_sms
+        for email, sms, message in items:
+            send_email(email, message)
+            send_sms(sms, message)
@@ -1,14 +1,14 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 from creational_patterns.abstract_factory.email_sender import IEmailSender
 from creational_patterns.abstract_factory.sms_sender import ISmsSender
 
 
-class IProviderFactory(ABC):
-    @abstractmethod
+class IProviderFactory(Protocol):
+    __slots__ = ()
+
     def create_email_sender(self) -> IEmailSender:
-        pass
+        ...
 
-    @abstractmethod
     def create_sms_sender(self) -> ISmsSender:
-        pass
+        ...
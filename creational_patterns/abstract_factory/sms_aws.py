@@ -1,6 +1,13 @@
+import sys
+
 from creational_patterns.abstract_factory.sms_sender import ISmsSender
 
 
 class AwsSmsSender(ISmsSender):
+    __slots__ = ()
+
+    _PREFIX = "Enviando SMS via AWS a "
+    _MID = "... mensaje: "
+
     def send(self, to: str, message: str) -> None:
-        print(f"Enviando SMS via AWS a {to}... mensaje: {message}")
+        sys.stdout.write(self._PREFIX + to + self._MID + message + "\n")
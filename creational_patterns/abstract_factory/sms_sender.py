@@ -1,7 +1,8 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 
-class ISmsSender(ABC):
-    @abstractmethod
+class ISmsSender(Protocol):
+    __slots__ = ()
+
     def send(self, to: str, message: str) -> None:
-        pass
+        ...
@@ -5,9 +5,15 @@ from creational_patterns.abstract_factory.sms_twilio import TwilioSmsSender
 from creational_patterns.abstract_factory.twilio_email import TwilioEmailSender
 
 
+# Los senders de Twilio no guardan estado, por lo que basta una sola
+# instancia compartida en lugar de crear una nueva en cada llamada.
+_EMAIL_SENDER = TwilioEmailSender()
+_SMS_SENDER = TwilioSmsSender()
+
+
 class TwilioFactory(IProviderFactory):
     def create_email_sender(self) -> IEmailSender:
-        return TwilioEmailSender()
+        return _EMAIL_SENDER
 
     def create_sms_sender(self) -> ISmsSender:
-        return TwilioSmsSender()
+        return _SMS_SENDER
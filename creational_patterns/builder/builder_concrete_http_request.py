@@ -3,12 +3,14 @@ from creational_patterns.builder.http_request import HttpRequest
 
 
 class BuilderConcreteHttpRequest(IBuilderHttpRequest):
-    _request: HttpRequest
-    _headers: dict
+    __slots__ = ("_request", "_headers")
 
     def reset(self) -> None:
         self._request = HttpRequest()
         self._headers = {}
+        # Se comparte el dict una sola vez; add_header luego muta en sitio
+        # sin volver a llamar set_headers por cada header.
+        self._request.set_headers(self._headers)
 
     def set_url(self, url: str) -> None:
         self._request.set_url(url)
@@ -24,7 +26,6 @@ class BuilderConcreteHttpRequest(IBuilderHttpRequest):
 
     def add_header(self, key: str, value: str) -> None:
         self._headers[key] = value
-        self._request.set_headers(self._headers)
     
     def get_request(self) -> HttpRequest:
         return self._request
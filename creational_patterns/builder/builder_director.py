@@ -1,33 +1,50 @@
+import sys
+
 from creational_patterns.builder.builder_http_request import IBuilderHttpRequest
 
+# Constantes internadas: las comparaciones de strings aguas abajo
+# (p.ej. request._method == "GET") resuelven por identidad de punteros.
+_URL = sys.intern("https://example.com")
+_AUTH = sys.intern("Bearer 1234567890")
+_METHOD_GET = sys.intern("GET")
+_METHOD_POST = sys.intern("POST")
+_METHOD_PUT = sys.intern("PUT")
+
+# Recetas del director: las tres variantes solo difieren en el metodo,
+# el body y si llevan header de autorizacion.
+_RECIPES = {
+    _METHOD_GET: {"body": None, "auth": False},
+    _METHOD_POST: {"body": {"key": "value"}, "auth": True},
+    _METHOD_PUT: {"body": {"key": "value"}, "auth": True},
+}
+
 
 class BuilderDirector:
-    _builder: IBuilderHttpRequest
+    __slots__ = ("_builder",)
 
     def __init__(self, builder: IBuilderHttpRequest):
         self._builder = builder
-    
+
     def change_builder(self, builder: IBuilderHttpRequest):
         self._builder = builder
-    
+
+    def build(self, method: str):
+        recipe = _RECIPES[method]
+        builder = self._builder
+        builder.reset()
+        builder.set_url(_URL)
+        builder.set_method(method)
+        if recipe["body"] is not None:
+            builder.set_body(recipe["body"])
+        builder.set_timeout(10)
+        if recipe["auth"]:
+            builder.add_header("Authorization", _AUTH)
+
     def build_get_request(self):
-        self._builder.reset()
-        self._builder.set_url("https://example.com")
-        self._builder.set_method("GET")
-        self._builder.set_timeout(10)
-    
+        self.build(_METHOD_GET)
+
     def build_post_request(self):
-        self._builder.reset()
-        self._builder.set_url("https://example.com")
-        self._builder.set_method("POST")
-        self._builder.set_body({"key": "value"})
-        self._builder.set_timeout(10)
-        self._builder.add_header("Authorization", "Bearer 1234567890")
+        self.build(_METHOD_POST)
 
     def build_put_request(self):
-        self._builder.reset()
-        self._builder.set_url("https://example.com")
-        self._builder.set_method("PUT")
-        self._builder.set_body({"key": "value"})
-        self._builder.set_timeout(10)
-        self._builder.add_header("Authorization", "Bearer 1234567890")
+        self.build(_METHOD_PUT)
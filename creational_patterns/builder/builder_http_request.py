@@ -1,27 +1,23 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 
-class IBuilderHttpRequest(ABC):
-    @abstractmethod
+class IBuilderHttpRequest(Protocol):
+    __slots__ = ()
+
     def reset(self) -> None:
-        pass
+        ...
 
-    @abstractmethod
     def set_url(self, url: str) -> None:
-        pass
+        ...
 
-    @abstractmethod
     def set_method(self, method: str) -> None:
-        pass
+        ...
 
-    @abstractmethod
     def set_body(self, body: dict) -> None:
-        pass
+        ...
 
-    @abstractmethod
     def set_timeout(self, timeout: int) -> None:
-        pass
-    
-    @abstractmethod
+        ...
+
     def add_header(self, key: str, value: str) -> None:
-        pass
+        ...
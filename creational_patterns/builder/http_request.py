@@ -1,9 +1,14 @@
 class HttpRequest:
-    _url: str
-    _method: str
-    _headers: dict = {}
-    _body: dict = {}
-    _timeout: int
+    __slots__ = ("_url", "_method", "_headers", "_body", "_timeout")
+
+    def __init__(self):
+        # Diccionarios propios de cada instancia; como atributos de clase
+        # se compartirian entre todas las requests.
+        self._url = ""
+        self._method = ""
+        self._headers = {}
+        self._body = {}
+        self._timeout = 0
 
     def set_url(self, url: str):
         self._url = url
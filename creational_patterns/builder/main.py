@@ -1,3 +1,5 @@
+import sys
+
 from creational_patterns.builder.builder_concrete_http_request import BuilderConcreteHttpRequest
 from creational_patterns.builder.builder_director import BuilderDirector
 from creational_patterns.builder.http_request import HttpRequest
@@ -6,18 +8,19 @@ from creational_patterns.builder.http_request import HttpRequest
 def run():
     builder: BuilderConcreteHttpRequest = BuilderConcreteHttpRequest()
     director: BuilderDirector = BuilderDirector(builder)
+    lines = []
 
     director.build_get_request()
     get_request: HttpRequest = builder.get_request()
-    print(get_request)
+    lines.append(repr(get_request))
 
     director.build_post_request()
     post_request: HttpRequest = builder.get_request()
-    print(post_request)
+    lines.append(repr(post_request))
 
     director.build_put_request()
     put_request: HttpRequest = builder.get_request()
-    print(put_request)
+    lines.append(repr(put_request))
 
     # Caso de uso sin director
     builder.reset()
@@ -26,7 +29,10 @@ def run():
     builder.set_timeout(10)
     builder.add_header("Authorization", "Bearer 1234567890")
     get_request: HttpRequest = builder.get_request()
-    print(get_request)
+    lines.append(repr(get_request))
+
+    # Una sola escritura a stdout en lugar de un print por request
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
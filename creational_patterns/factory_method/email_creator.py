@@ -1,8 +1,12 @@
 from creational_patterns.factory_method.email_notification import EmailNotification
-from creational_patterns.factory_method.notification import INotification
 from creational_patterns.factory_method.notification_creator import NotificationCreator
 
+# Instancia compartida: EmailNotification no guarda estado.
+_NOTIFICATION = EmailNotification()
+
 
 class EmailCreator(NotificationCreator):
-    def create_notification(self) -> INotification:
-        return EmailNotification()
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(_NOTIFICATION)
@@ -1,8 +1,8 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 
-class INotification(ABC):
+class INotification(Protocol):
+    __slots__ = ()
 
-    @abstractmethod
     def send(self, message: str) -> None:
-        pass
+        ...
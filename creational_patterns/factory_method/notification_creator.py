@@ -1,14 +1,14 @@
-from abc import ABC, abstractmethod
-
 from creational_patterns.factory_method.notification import INotification
 
 
-class NotificationCreator(ABC):
+class NotificationCreator:
+    __slots__ = ("_send",)
 
-    @abstractmethod
-    def create_notification(self) -> INotification:
-        pass
+    def __init__(self, notification: INotification):
+        # Se guarda el metodo send ya ligado de la notificacion compartida:
+        # cada send_notification es una sola llamada, sin crear la
+        # notificacion ni resolver atributos en el camino.
+        self._send = notification.send
 
     def send_notification(self, message: str) -> None:
-        notification: INotification = self.create_notification()
-        notification.send(message)
+        self._send(message)
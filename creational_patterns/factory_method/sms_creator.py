@@ -1,8 +1,12 @@
-from creational_patterns.factory_method.notification import INotification
 from creational_patterns.factory_method.notification_creator import NotificationCreator
 from creational_patterns.factory_method.sms_notification import SmsNotification
 
+# Instancia compartida: SmsNotification no guarda estado.
+_NOTIFICATION = SmsNotification()
+
 
 class SmsCreator(NotificationCreator):
-    def create_notification(self) -> INotification:
-        return SmsNotification()
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(_NOTIFICATION)
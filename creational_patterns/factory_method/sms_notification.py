@@ -1,6 +1,12 @@
+import sys
+
 from creational_patterns.factory_method.notification import INotification
 
 
 class SmsNotification(INotification):
+    __slots__ = ()
+
+    _PREFIX = "Enviando notificacion via SMS... mensaje: "
+
     def send(self, message: str) -> None:
-        print(f"Enviando notificacion via SMS... mensaje: {message}")
+        sys.stdout.write(self._PREFIX + message + "\n")
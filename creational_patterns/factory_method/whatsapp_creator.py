@@ -1,8 +1,12 @@
-from creational_patterns.factory_method.notification import INotification
 from creational_patterns.factory_method.notification_creator import NotificationCreator
 from creational_patterns.factory_method.whatsapp_notification import WhatsappNotification
 
+# Instancia compartida: WhatsappNotification no guarda estado.
+_NOTIFICATION = WhatsappNotification()
+
 
 class WhatsappCreator(NotificationCreator):
-    def create_notification(self) -> INotification:
-        return WhatsappNotification()
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(_NOTIFICATION)
@@ -1,6 +1,12 @@
+import sys
+
 from creational_patterns.factory_method.notification import INotification
 
 
 class WhatsappNotification(INotification):
+    __slots__ = ()
+
+    _PREFIX = "Enviando notificacion via Whatsapp... mensaje: "
+
     def send(self, message: str) -> None:
-        print(f"Enviando notificacion via Whatsapp... mensaje: {message}")
+        sys.stdout.write(self._PREFIX + message + "\n")
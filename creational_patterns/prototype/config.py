@@ -1,8 +1,25 @@
 from creational_patterns.prototype.prototype_job import IPrototypeJob
 from typing import Any, Dict
 import copy
+import json
+
+
+def _copy_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    # Los metadatos son tipo JSON, asi que un round-trip por el modulo json
+    # (acelerado en C) copia estructuras anidadas mucho mas rapido que la
+    # maquinaria generica de copy.deepcopy. Si aparece un valor no
+    # serializable, se cae al deepcopy como ruta lenta pero correcta.
+    if not metadata:
+        return {}
+    try:
+        return json.loads(json.dumps(metadata))
+    except TypeError:
+        return copy.deepcopy(metadata)
+
 
 class JobConfig(IPrototypeJob):
+    __slots__ = ("_name", "_retries", "_timeout", "metadata")
+
     def __init__(
         self, 
         name: str, 
@@ -16,7 +33,12 @@ class JobConfig(IPrototypeJob):
         self.metadata = metadata
 
     def clone(self) -> "JobConfig":
-        return copy.deepcopy(self)
+        return JobConfig(
+            self._name,
+            self._retries,
+            self._timeout,
+            _copy_metadata(self.metadata),
+        )
 
     def __repr__(self):
         return (
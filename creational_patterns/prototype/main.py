@@ -1,34 +1,8 @@
-from creational_patterns.prototype.config import JobConfig
 from creational_patterns.prototype.templates import JobTemplates
 
 
-def register_templates():
-    JobTemplates.register(
-        "fast",
-        JobConfig(
-            name="fast-job",
-            retries=1,
-            timeout=5,
-            metadata={
-                "priority": "high"
-            }
-        )
-    )
-    JobTemplates.register(
-        "safe",
-        JobConfig(
-            name="safe-job",
-            retries=5,
-            timeout=30,
-            metadata={
-                "priority": "low"
-            }
-        )
-    )
-
-
 def run():
-    register_templates()
+    # Los templates quedan registrados al importar JobTemplates
     job1 = JobTemplates.get("fast")
     job2 = JobTemplates.get("fast")
     job3 = JobTemplates.get("safe")
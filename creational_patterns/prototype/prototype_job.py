@@ -1,9 +1,8 @@
-from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Protocol
 
 
-class IPrototypeJob(ABC):
+class IPrototypeJob(Protocol):
+    __slots__ = ()
 
-    @abstractmethod
     def clone(self) -> Any:
-        pass
+        ...
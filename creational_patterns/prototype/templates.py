@@ -1,3 +1,4 @@
+import types
 from typing import Dict
 from creational_patterns.prototype.config import JobConfig
 
@@ -11,6 +12,48 @@ class JobTemplates:
 
     @classmethod
     def get(cls, key: str) -> JobConfig:
-        if key not in cls._templates:
+        template = cls._templates.get(key)
+        if template is None:
             raise ValueError(f"Template with key {key} not found")
-        return cls._templates[key].clone()
+        return template.clone()
+
+    @classmethod
+    def get_readonly(cls, key: str) -> JobConfig:
+        # Variante sin clone para consumidores que solo leen: los escalares
+        # se comparten y metadata se expone como vista inmutable, asi que
+        # no se copia nada.
+        template = cls._templates.get(key)
+        if template is None:
+            raise ValueError(f"Template with key {key} not found")
+        readonly = object.__new__(JobConfig)
+        readonly._name = template._name
+        readonly._retries = template._retries
+        readonly._timeout = template._timeout
+        readonly.metadata = types.MappingProxyType(template.metadata)
+        return readonly
+
+
+# Los prototipos se registran una sola vez al importar el módulo; los
+# consumidores solo llaman JobTemplates.get sin re-registrar en cada run.
+JobTemplates.register(
+    "fast",
+    JobConfig(
+        name="fast-job",
+        retries=1,
+        timeout=5,
+        metadata={
+            "priority": "high"
+        }
+    )
+)
+JobTemplates.register(
+    "safe",
+    JobConfig(
+        name="safe-job",
+        retries=5,
+        timeout=30,
+        metadata={
+            "priority": "low"
+        }
+    )
+)
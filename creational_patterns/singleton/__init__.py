@@ -1,15 +1,19 @@
 """
 Patrón Singleton - Garantiza una única instancia de una clase.
 
-Este módulo implementa el patrón de diseño Singleton usando un decorador de clase,
-aplicado a un caso de uso real: configuración de base de datos PostgreSQL.
+Este módulo implementa el patrón de diseño Singleton usando una instancia a
+nivel de módulo, aplicado a un caso de uso real: configuración de base de
+datos PostgreSQL. El decorador `singleton` se conserva como referencia de la
+variante basada en decorador.
 
 Exports:
     singleton: Decorador para convertir cualquier clase en Singleton
-    DatabaseConfig: Configuración Singleton para PostgreSQL
+    DatabaseConfig: Configuración para PostgreSQL
+    config: Instancia única de DatabaseConfig construida en el import
+    get_config: Retorna la instancia única pre-construida
 """
 
 from creational_patterns.singleton.decorator import singleton
-from creational_patterns.singleton.db import DatabaseConfig
+from creational_patterns.singleton.db import DatabaseConfig, config, get_config
 
-__all__ = ['singleton', 'DatabaseConfig']
+__all__ = ['singleton', 'DatabaseConfig', 'config', 'get_config']
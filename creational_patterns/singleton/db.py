@@ -4,19 +4,22 @@
 # la configuración de conexión a PostgreSQL, asegurando que solo exista una instancia
 # de configuración en toda la aplicación.
 
+# La instancia única vive a nivel de módulo: como Python importa cada módulo
+# una sola vez, el acceso es un simple lookup de nombre sin pasar por el
+# wrapper (función + dict) que añade el decorador @singleton.
+
 import os
-from creational_patterns.singleton.decorator import singleton
+import types
 
 
-@singleton
 class DatabaseConfig:
     """
-    Configuración Singleton para conexión a PostgreSQL.
-    
-    Esta clase garantiza que solo exista una instancia de configuración en toda
-    la aplicación, evitando múltiples lecturas de variables de entorno y
-    asegurando consistencia en la configuración.
-    
+    Configuración para conexión a PostgreSQL.
+
+    La instancia única se construye al importar el módulo y se accede vía
+    `config` o `get_config()`, evitando múltiples lecturas de variables de
+    entorno y asegurando consistencia en la configuración.
+
     Variables de entorno:
         DB_HOST: Host del servidor PostgreSQL (default: localhost)
         DB_PORT: Puerto de PostgreSQL (default: 5432)
@@ -28,16 +31,35 @@ class DatabaseConfig:
     def __init__(self):
         """
         Inicializa la configuración leyendo variables de entorno.
-        
-        Este método solo se ejecuta una vez debido al decorador @singleton,
-        incluso si se intenta crear múltiples instancias.
+
+        Solo se ejecuta una vez por proceso: al construir la instancia
+        `config` de este módulo durante el import.
         """
-        self._host = os.getenv('DB_HOST', 'localhost')
-        self._port = int(os.getenv('DB_PORT', '5432'))
-        self._user = os.getenv('DB_USER', 'postgres')
-        self._password = os.getenv('DB_PASSWORD', 'postgres')
-        self._database = os.getenv('DB_NAME', 'mydatabase')
-        
+        # Binding local de os.environ.get: evita repetir el lookup de
+        # atributo que os.getenv hace internamente en cada llamada.
+        env = os.environ.get
+        self._host = env('DB_HOST', 'localhost')
+        self._port = int(env('DB_PORT', '5432'))
+        self._user = env('DB_USER', 'postgres')
+        self._password = env('DB_PASSWORD', 'postgres')
+        self._database = env('DB_NAME', 'mydatabase')
+
+        # Los campos no cambian tras el init, así que las cadenas de
+        # conexión y el diccionario se calculan una sola vez aquí.
+        self._conn_str_hidden = (
+            f"postgresql://{self._user}:****@{self._host}:{self._port}/{self._database}"
+        )
+        self._conn_str_visible = (
+            f"postgresql://{self._user}:{self._password}@{self._host}:{self._port}/{self._database}"
+        )
+        self._conn_dict = types.MappingProxyType({
+            'host': self._host,
+            'port': self._port,
+            'user': self._user,
+            'password': self._password,
+            'database': self._database
+        })
+
         print(f"[Singleton] Configuración de DB inicializada para: {self._host}:{self._port}")
     
     @property
@@ -67,32 +89,39 @@ class DatabaseConfig:
     
     def get_connection_string(self, hide_password: bool = True) -> str:
         """
-        Genera la cadena de conexión para PostgreSQL.
-        
+        Retorna la cadena de conexión para PostgreSQL, precalculada en el init.
+
         Args:
             hide_password: Si es True, oculta la contraseña en la cadena (default: True)
-        
+
         Returns:
             Cadena de conexión en formato PostgreSQL URI
         """
-        password = "****" if hide_password else self._password
-        return f"postgresql://{self._user}:{password}@{self._host}:{self._port}/{self._database}"
-    
-    def get_connection_dict(self) -> dict:
+        return self._conn_str_hidden if hide_password else self._conn_str_visible
+
+    def get_connection_dict(self) -> types.MappingProxyType:
         """
-        Retorna un diccionario con los parámetros de conexión.
-        
+        Retorna una vista de solo lectura con los parámetros de conexión.
+
         Returns:
-            Diccionario con los parámetros de conexión
+            Vista inmutable (MappingProxyType) de los parámetros de conexión
         """
-        return {
-            'host': self._host,
-            'port': self._port,
-            'user': self._user,
-            'password': self._password,
-            'database': self._database
-        }
+        return self._conn_dict
     
     def __repr__(self) -> str:
         """Representación string de la configuración."""
         return f"DatabaseConfig(host={self._host}, port={self._port}, database={self._database})"
+
+
+# Instancia única construida en el import del módulo.
+config = DatabaseConfig()
+
+
+def get_config() -> DatabaseConfig:
+    """
+    Retorna la instancia única de configuración.
+
+    Alternativa estilo fábrica a importar `config` directamente; no hay
+    lock ni lookup en dict, solo el retorno del global pre-construido.
+    """
+    return config
@@ -1,7 +1,18 @@
+import sys
+
 from structural_patterns.adapter.payment_processor import PaymentProcessor
 
+_FAILED_MESSAGE = "Pago fallido"
+
+
+class PaymentFailedError(Exception):
+    """Se lanza cuando el procesador de pagos rechaza la transaccion."""
+    __slots__ = ()
+
 
 class CheckoutService:
+    __slots__ = ("_payment_processor",)
+
     def __init__(self, payment_processor: PaymentProcessor):
         self._payment_processor = payment_processor
 
@@ -9,6 +20,8 @@ class CheckoutService:
         success = self._payment_processor.pay(amount, "COP")
 
         if not success:
-            raise Exception("Pago fallido")
+            # Instancia nueva por raise: el traceback pertenece a cada
+            # fallo, solo el mensaje es compartido.
+            raise PaymentFailedError(_FAILED_MESSAGE)
 
-        print("Pago exitoso")
+        sys.stdout.write("Pago exitoso\n")
@@ -1,19 +1,29 @@
+import sys
+
 from structural_patterns.adapter.external_payment_sdk import ExternalPaymentSDK
 from structural_patterns.adapter.payment_processor import PaymentProcessor
 
+# Constante internada: la comparacion de igualdad resuelve por identidad
+# de punteros cuando ambos lados estan internados.
+_SUCCESS = sys.intern("success")
+
 
 class ExternalPaymentAdapter(PaymentProcessor):
+    __slots__ = ("_external_sdk",)
+
     def __init__(self, external_sdk: ExternalPaymentSDK):
         self._external_sdk = external_sdk
 
     def pay(self, amount: float, currency: str) -> bool:
-        # Adaptación de formato
-        total_in_cents = int(amount * 100)
+        # Adaptación de formato: round en lugar de int, que truncaba el
+        # error binario del float (p.ej. 1.15 * 100 = 114.999... -> 114).
+        total_in_cents = round(amount * 100)
 
         response = self._external_sdk.make_transaction(
             total_in_cents=total_in_cents,
             currency_code=currency
         )
 
-        # Adaptación de respuesta
-        return response.get("status") == "success"
+        # Adaptación de respuesta: el SDK siempre incluye "status", así que
+        # se indexa directo sin el manejo de default de dict.get.
+        return response["status"] == _SUCCESS
@@ -1,7 +1,8 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 
-class PaymentProcessor(ABC):
-    @abstractmethod
+class PaymentProcessor(Protocol):
+    __slots__ = ()
+
     def pay(self, amount: float, currency: str) -> bool:
-        pass
+        ...